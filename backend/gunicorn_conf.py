@@ -0,0 +1,17 @@
+"""
+Gunicorn configuration for HRMS Lite backend.
+
+Usage:
+    gunicorn app.main:app -c gunicorn_conf.py --bind 0.0.0.0:8000
+"""
+
+import os
+
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1) + 1))
+worker_connections = 1000
+keepalive = 5
+
+# Per-request access logging is synchronous I/O on the event loop; errors
+# are still logged.
+accesslog = None
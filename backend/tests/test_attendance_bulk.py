@@ -0,0 +1,108 @@
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from fastapi_cache import FastAPICache
+from sqlalchemy.sql import Insert
+
+from app.main import ATTENDANCE_BULK_MAX_ROWS, app, get_db, init_response_cache
+
+
+class FakeResult:
+    def __init__(self, values):
+        self._values = values
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._values
+
+
+class FakeSession:
+    def __init__(self):
+        # employee id -> is_active
+        self.employees = {1: True, 2: True, 3: False}
+        self.attendance = {(1, date(2024, 1, 1))}
+        self.inserts = 0
+
+    async def scalars(self, statement):
+        # Active-employee lookup: SELECT id WHERE id IN (...) AND is_active.
+        (requested,) = [
+            value
+            for value in statement.compile().params.values()
+            if isinstance(value, (list, tuple))
+        ]
+        return [pk for pk in requested if self.employees.get(pk)]
+
+    async def execute(self, statement, rows):
+        assert isinstance(statement, Insert)
+        self.inserts += 1
+        inserted = []
+        for row in rows:
+            key = (row["employee_id"], row["date"])
+            if key not in self.attendance:
+                self.attendance.add(key)
+                inserted.append(len(self.attendance))
+        return FakeResult(inserted)
+
+    async def commit(self):
+        pass
+
+
+@pytest.fixture
+def fake_db():
+    session = FakeSession()
+
+    async def override_get_db():
+        yield session
+
+    init_response_cache(SimpleNamespace(), redis_url=None)
+    app.dependency_overrides[get_db] = override_get_db
+    yield session
+    app.dependency_overrides.clear()
+    FastAPICache.reset()
+
+
+def test_bulk_attendance_reports_inserted_and_skipped(fake_db):
+    client = TestClient(app)
+    rows = [
+        {"employee_id": 1, "date": "2024-01-01", "status": "Present"},  # already recorded
+        {"employee_id": 1, "date": "2024-01-02", "status": "Present"},
+        {"employee_id": 2, "date": "2024-01-02", "status": "Absent"},
+        {"employee_id": 2, "date": "2024-01-02", "status": "Present"},  # duplicate in body
+    ]
+
+    response = client.post("/api/attendance/bulk", json=rows)
+
+    assert response.status_code == 201
+    assert response.json() == {"inserted": 2, "skipped": 2}
+    assert fake_db.inserts == 1
+
+
+@pytest.mark.parametrize("employee_id", [3, 99], ids=["inactive", "unknown"])
+def test_bulk_attendance_rejects_missing_employee(fake_db, employee_id):
+    client = TestClient(app)
+    rows = [
+        {"employee_id": 1, "date": "2024-01-02", "status": "Present"},
+        {"employee_id": employee_id, "date": "2024-01-02", "status": "Present"},
+    ]
+
+    response = client.post("/api/attendance/bulk", json=rows)
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Employee not found"}
+    assert fake_db.inserts == 0
+
+
+def test_bulk_attendance_rejects_oversized_body():
+    client = TestClient(app)
+    rows = [
+        {"employee_id": 1, "date": "2024-01-01", "status": "Present"}
+        for _ in range(ATTENDANCE_BULK_MAX_ROWS + 1)
+    ]
+
+    response = client.post("/api/attendance/bulk", json=rows)
+
+    assert response.status_code == 422
@@ -0,0 +1,111 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+from app.main import app, get_db, init_response_cache, request_key_builder
+
+
+class UnavailableBackend(InMemoryBackend):
+    async def clear(self, namespace=None, key=None):
+        raise ConnectionError("cache unavailable")
+
+
+class FakeSession:
+    def __init__(self):
+        self.employee = SimpleNamespace(
+            id=1,
+            employee_id="E001",
+            full_name="Ada Lovelace",
+            email="ada@example.com",
+            department="Engineering",
+            is_active=True,
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+        self.selects = 0
+
+    async def execute(self, statement):
+        self.selects += 1
+        return [self.employee] if self.employee.is_active else []
+
+    async def get(self, model, pk):
+        return self.employee if pk == self.employee.id else None
+
+    async def commit(self):
+        pass
+
+
+@pytest.fixture
+def fake_db():
+    session = FakeSession()
+
+    async def override_get_db():
+        yield session
+
+    FastAPICache.init(InMemoryBackend(), prefix="hrms-cache", key_builder=request_key_builder)
+    app.dependency_overrides[get_db] = override_get_db
+    yield session
+    app.dependency_overrides.clear()
+    FastAPICache.reset()
+
+
+def test_employee_list_is_cached_per_query_string(fake_db):
+    client = TestClient(app)
+
+    assert client.get("/api/employees").headers["x-fastapi-cache"] == "MISS"
+    assert client.get("/api/employees").headers["x-fastapi-cache"] == "HIT"
+    assert client.get("/api/employees?department=HR").headers["x-fastapi-cache"] == "MISS"
+    assert fake_db.selects == 2
+
+
+def test_employee_write_invalidates_list_cache(fake_db):
+    client = TestClient(app)
+
+    assert len(client.get("/api/employees").json()) == 1
+    assert client.get("/api/employees").headers["x-fastapi-cache"] == "HIT"
+
+    assert client.delete("/api/employees/1").status_code == 204
+
+    response = client.get("/api/employees")
+    assert response.headers["x-fastapi-cache"] == "MISS"
+    assert response.json() == []
+
+
+def test_cached_list_gets_stable_private_etag(fake_db):
+    client = TestClient(app)
+
+    miss = client.get("/api/employees")
+    hit = client.get("/api/employees")
+    assert hit.headers["x-fastapi-cache"] == "HIT"
+    assert miss.headers["etag"] == hit.headers["etag"]
+    assert not miss.headers["etag"].startswith("W/")
+    assert hit.headers["cache-control"] == "private, no-cache"
+
+    response = client.get("/api/employees", headers={"If-None-Match": hit.headers["etag"]})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_write_succeeds_when_cache_invalidation_fails(fake_db):
+    FastAPICache.reset()
+    FastAPICache.init(UnavailableBackend(), prefix="hrms-cache", key_builder=request_key_builder)
+    client = TestClient(app)
+
+    assert client.delete("/api/employees/1").status_code == 204
+    assert fake_db.employee.is_active is False
+
+
+def test_cache_disabled_without_redis(fake_db):
+    FastAPICache.reset()
+    init_response_cache(SimpleNamespace(), redis_url=None)
+    client = TestClient(app)
+
+    first = client.get("/api/employees")
+    second = client.get("/api/employees")
+
+    assert "x-fastapi-cache" not in second.headers
+    assert first.json() == second.json()
+    assert fake_db.selects == 2
@@ -0,0 +1,111 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from fastapi_cache import FastAPICache
+
+from app.main import app, get_db, init_response_cache
+
+
+def make_employee(pk, email):
+    return SimpleNamespace(
+        id=pk,
+        employee_id=f"E{pk:03d}",
+        full_name=f"Employee {pk}",
+        email=email,
+        department=None,
+        is_active=True,
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+class FakeResult:
+    def __init__(self, values):
+        self._values = values
+
+    def all(self):
+        return self._values
+
+
+class FakeSession:
+    def __init__(self):
+        self.employees = {
+            1: make_employee(1, "ada@example.com"),
+            2: make_employee(2, "grace@example.com"),
+        }
+        self.commits = 0
+
+    async def get(self, model, pk):
+        return self.employees.get(pk)
+
+    async def scalars(self, statement):
+        # update_employee lookup: WHERE id = :id OR email = :email LIMIT 2.
+        criteria = {
+            clause.left.key: clause.right.value for clause in statement.whereclause.clauses
+        }
+        matches = [
+            employee
+            for employee in self.employees.values()
+            if employee.id == criteria["id"] or employee.email == criteria["email"]
+        ]
+        return FakeResult(matches[:2])
+
+    async def commit(self):
+        self.commits += 1
+
+
+@pytest.fixture
+def fake_db():
+    session = FakeSession()
+
+    async def override_get_db():
+        yield session
+
+    init_response_cache(SimpleNamespace(), redis_url=None)
+    app.dependency_overrides[get_db] = override_get_db
+    yield session
+    app.dependency_overrides.clear()
+    FastAPICache.reset()
+
+
+def test_update_employee_keeps_own_email(fake_db):
+    client = TestClient(app)
+
+    response = client.put(
+        "/api/employees/1",
+        json={"email": "ada@example.com", "full_name": "Ada King"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["full_name"] == "Ada King"
+    assert fake_db.commits == 1
+
+
+def test_update_employee_rejects_email_of_another_employee(fake_db):
+    client = TestClient(app)
+
+    response = client.put("/api/employees/1", json={"email": "grace@example.com"})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Email is already in use"}
+    assert fake_db.employees[1].email == "ada@example.com"
+    assert fake_db.commits == 0
+
+
+def test_update_unknown_employee_with_taken_email_is_not_found(fake_db):
+    client = TestClient(app)
+
+    response = client.put("/api/employees/99", json={"email": "grace@example.com"})
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Employee not found"}
+
+
+def test_update_unknown_employee_without_email_is_not_found(fake_db):
+    client = TestClient(app)
+
+    response = client.put("/api/employees/99", json={"full_name": "Nobody"})
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Employee not found"}